@@ -0,0 +1,55 @@
+"""Microbenchmark of refreshing unchanged contacts.
+
+The incremental `Contacts.get_contact_name_email` is compared with the full rebuild of
+every `Person` it replaced.
+
+Run with: uv run python -m benchmarks.bench_contacts
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("SMTP_USR", "bench@domain.nl")
+os.environ.setdefault("REPLY_TO", "bench@domain.nl")
+os.environ.setdefault("CONTACTS_SHEET_ID", "bench")
+os.environ.setdefault("CONTACTS_SHEET_RANGE", "2:40")
+
+from src.mail_groene_maaiers.mail_groene_maaiers import Contacts, Person, PersonInfo
+
+SHEET = [
+    [f"Name{i} LastName{i}", f"name{i}@domain.nl", f"adres {i}", f"extra {i}"] for i in range(1000)
+]
+
+
+def legacy_rebuild(sheet: list[list[str]]) -> PersonInfo:
+    """Build all contacts as `Contacts.get_contact_name_email` did before diffing rows."""
+    name_mail_dict = {}
+    for line in sheet:
+        if len(line) == 4:
+            name, email, _, extra_namen = line
+        elif len(line) == 3:
+            extra_namen = ""
+            name, email, _ = line
+        else:
+            continue
+        name_mail_dict[name] = Person(name=name, email=email, extra=extra_namen)
+    return name_mail_dict
+
+
+def per_refresh(func) -> float:
+    """Return the best time per refresh in milliseconds."""
+    number = 20
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e3
+
+
+def main() -> None:
+    """Print the time per refresh of 1000 unchanged rows."""
+    contacts = Contacts(credentials=None, notification=None)  # type: ignore
+    contacts.sheet = SHEET
+    contacts.get_contact_name_email()
+    print(f"     rebuild: {per_refresh(lambda: legacy_rebuild(SHEET)):6.3f} ms/refresh")
+    print(f" incremental: {per_refresh(contacts.get_contact_name_email):6.3f} ms/refresh")
+
+
+if __name__ == "__main__":
+    main()
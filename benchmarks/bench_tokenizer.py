@@ -0,0 +1,105 @@
+"""Microbenchmark of splitting and resolving the names of a large schedule.
+
+The previous implementation of `ScheduleSheet._get_names_list` and
+`Contacts._find_email_based_on_name_list` is compared with the current one, on cells with
+unique names per cell and on cells repeating a name in another spelling.
+
+Run with: uv run python -m benchmarks.bench_tokenizer
+"""
+
+import os
+import random
+import re
+import timeit
+
+os.environ.setdefault("SMTP_USR", "bench@domain.nl")
+os.environ.setdefault("REPLY_TO", "bench@domain.nl")
+os.environ.setdefault("CONTACTS_SHEET_ID", "bench")
+os.environ.setdefault("CONTACTS_SHEET_RANGE", "2:40")
+
+from src.mail_groene_maaiers.mail_groene_maaiers import (
+    Contacts,
+    Person,
+    PersonInfo,
+    name_tokenizer,
+)
+
+FIRST_NAMES = [f"Volunteer{i}" for i in range(60)]
+CONTACTS: PersonInfo = {
+    f"{name} LastName": Person(
+        name=f"{name} LastName", email=f"{name.lower()}@domain.nl", extra=f"Partner{i}"
+    )
+    for i, name in enumerate(FIRST_NAMES)
+}
+rng = random.Random(0)  # noqa: S311
+UNIQUE_CELLS = [
+    ", ".join(rng.sample(FIRST_NAMES, 2)) + f" en Partner{rng.randrange(60)}" for _ in range(2000)
+]
+REPEATED_CELLS = [f"{cell}, {cell.split(',')[0].upper()}" for cell in UNIQUE_CELLS]
+
+
+def legacy_names_list(names: str) -> list[str]:
+    """Split the names as `ScheduleSheet._get_names_list` did before the tokenizer."""
+    split_names = re.split(pattern=r",| en |/|\.", string=names)
+    return [name.strip() for name in split_names if name]
+
+
+def legacy_find_email(name: str, contacts: PersonInfo) -> set[str]:
+    """Resolve a name as `Contacts._find_email_based_on_name_list` did before the tokenizer."""
+    name = name.lower()
+    email_list = [data.email for key, data in contacts.items() if key.lower().startswith(name)]
+    if not email_list:
+        regex = re.compile(pattern=rf"\b{name}\b", flags=re.IGNORECASE)
+        for data in contacts.values():
+            if data.extra and regex.search(data.extra):
+                email_list.append(data.email)
+    return set(email_list)
+
+
+def legacy_split(cells: list[str]) -> None:
+    """Split all cells the previous way."""
+    for cell in cells:
+        legacy_names_list(cell)
+
+
+def legacy(cells: list[str]) -> None:
+    """Split and resolve all cells the previous way."""
+    for cell in cells:
+        for name in legacy_names_list(cell):
+            legacy_find_email(name, CONTACTS)
+
+
+def current_split(cells: list[str]) -> None:
+    """Split all cells using the tokenizer."""
+    for cell in cells:
+        name_tokenizer.split(cell)
+
+
+def current(cells: list[str], contacts: Contacts) -> None:
+    """Split and resolve all cells using the tokenizer."""
+    for cell in cells:
+        for name in name_tokenizer.split(cell):
+            contacts._find_email_based_on_name_list(name, CONTACTS)
+
+
+def per_cell(func, cells: list[str]) -> float:
+    """Return the best time per cell in microseconds."""
+    number = 3
+    return (
+        min(timeit.repeat(lambda: func(cells), number=number, repeat=5)) / number / len(cells) * 1e6
+    )
+
+
+def main() -> None:
+    """Print the time per cell for both implementations."""
+    contacts = Contacts(credentials=None, notification=None)  # type: ignore
+    for label, cells in (("unique names", UNIQUE_CELLS), ("repeated names", REPEATED_CELLS)):
+        print(label)
+        print(f"  split legacy:   {per_cell(legacy_split, cells):8.2f} us/cell")
+        print(f"  split current:  {per_cell(current_split, cells):8.2f} us/cell")
+        print(f"  total legacy:   {per_cell(legacy, cells):8.2f} us/cell")
+        print(f"  total current:  {per_cell(lambda c: current(c, contacts), cells):8.2f} us/cell")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,35 @@
 
 import os
 import sys
+from pathlib import Path
 
+from environs import env
 from google.oauth2 import service_account
 
 from src.mail_groene_maaiers.mail_groene_maaiers import (
     Contacts,
-    EmailNotification,
+    NameCache,
+    NotificationDispatcher,
+    RunHistory,
     ScheduleSheet,
+    history_report,
+    notification_backends,
 )
 
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
 
-def main() -> None:
-    """Call main function."""
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    credentials_file = os.path.join(base_path, "credentials.json")
+
+def run(history: RunHistory) -> str:
+    """Send the reminder, measuring each stage in the run history.
+
+    Args:
+        history (RunHistory): The run history to record the measurements in
+
+    Returns:
+        str: the outcome of the run
+
+    """
+    credentials_file = os.path.join(BASE_PATH, "credentials.json")
     scopes = [
         "https://www.googleapis.com/auth/contacts.readonly",
         "https://www.googleapis.com/auth/spreadsheets.readonly",
@@ -24,27 +39,65 @@ def main() -> None:
     credentials = service_account.Credentials.from_service_account_file(
         credentials_file, scopes=scopes
     )
-    notify = EmailNotification()
+    notify = NotificationDispatcher(
+        backends=notification_backends(env.list("NOTIFY_BACKENDS", default=["email"])),
+        timeout=env.float("NOTIFY_TIMEOUT", default=30.0),
+    )
     schedule_sheet = ScheduleSheet(credentials=credentials, notification=notify)
-    schedule_sheet.get_sheet()
+    with history.stage("fetch_schedule"):
+        schedule_sheet.get_sheet()
+    history.record.payload_sizes["schedule"] = schedule_sheet.payload_size
     names, err = schedule_sheet.names_next_date()
     if schedule_sheet.date_not_found:
         print("No work planned for this weekend. Done.")
-        return
+        return "no work planned"
     if err:
-        notify.admin_message(err)
+        with history.stage("send"):
+            notify.admin_message(err)
+            notify.send_message()
+        return f"admin notified: {err}"
+
+    # continue matching it with the contact information
+    name_cache = NameCache(
+        path=env.path("NAME_CACHE_FILE", default=Path(BASE_PATH) / "name_cache.json"),
+        max_size=env.int("NAME_CACHE_SIZE", default=256),
+    )
+    name_cache.load()
+    contacts = Contacts(credentials=credentials, notification=notify, name_cache=name_cache)
+    with history.stage("fetch_contacts"):
+        contacts.get_sheet()
+    history.record.payload_sizes["contacts"] = contacts.payload_size
+    with history.stage("matching"):
+        contacts.get_contact_name_email()
+        mailing_list = contacts.generate_mailing_list(names)
+    name_cache.save()
+    history.record.recipients = len(mailing_list)
+
+    with history.stage("send"):
+        contacts.notify_unresolved()
+        notify.standard_message(names=names, emails=mailing_list)
         notify.send_message()
+    return "sent"
+
+
+def main() -> None:
+    """Call main function, `main.py report` prints the run history percentiles."""
+    history = RunHistory(
+        path=env.path("RUN_HISTORY_FILE", default=Path(BASE_PATH) / "run_history.jsonl"),
+        tenant=env.str("TENANT", default="default"),
+    )
+    if sys.argv[1:] == ["report"]:
+        print(history_report(history.load()))
         return
 
-    # continue matching it with the contact information
-    contacts = Contacts(credentials=credentials, notification=notify)
-    contacts.get_sheet()
-    contacts.get_contact_name_email()
-    mailing_list = contacts.generate_mailing_list(names)
-
-    notify.standard_message(names=names, emails=mailing_list)
-    notify.send_message()
-    return
+    try:
+        with history.stage("total"), history.count_retries():
+            history.record.outcome = run(history)
+    except Exception as err:
+        history.record.outcome = f"error: {type(err).__name__}"
+        raise
+    finally:
+        history.save()
 
 
 if __name__ == "__main__":
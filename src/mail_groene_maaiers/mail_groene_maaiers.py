@@ -1,14 +1,29 @@
 #!/usr/bin/env python3
 """Groene maaiers script for sending emails to enlisted users on a Gsheet."""
 
+import hashlib
+import json
 import logging
+import mailbox
+import math
+import os
 import re
 import smtplib
 import ssl
+import tempfile
+import time
+import unicodedata
+import urllib.request
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import date, timedelta
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
 from email.message import EmailMessage
+from functools import lru_cache, partial
+from pathlib import Path
 
 from environs import env
 from google.oauth2.service_account import Credentials
@@ -24,6 +39,10 @@ class SendMailError(Exception):
     """Send Email Error exception."""
 
 
+class ConfigurationError(Exception):
+    """Configuration Error exception."""
+
+
 @dataclass
 class Person:
     """Person data class."""
@@ -31,6 +50,22 @@ class Person:
     name: str
     email: str
     extra: str = ""
+    name_key: str = field(init=False, repr=False, compare=False)
+    extra_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Normalize the name and extra field once, for matching."""
+        self.name_key = name_tokenizer.key(self.name)
+        self.extra_key = name_tokenizer.key(self.extra)
+
+
+@dataclass
+class ContactsDiff:
+    """Names of the contacts which changed between two fetches."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
 
 
 type PersonInfo = dict[str, Person]
@@ -103,38 +138,23 @@ class Notification(ABC):
         """Generate a standard message."""
 
 
-class EmailNotification(Notification):
-    """Class to send out an email notification."""
+class MessageNotification(Notification):
+    """Base class for notifications which are built as an email message."""
 
     message: EmailMessage
 
     def __init__(self) -> None:
-        """Init EmailNotification."""
-        self.email_on = env.bool("EMAIL_ON", default=False)
-        self.smtp_srv = env.str("SMTP_SRV")
-        self.smtp_port = env.int("SMTP_PORT", default=465)
-        self.smtp_usr = env.str("SMTP_USR")
-        self.smtp_pwd = env.str("SMTP_PWD")
+        """Init MessageNotification."""
+        self.mail_from = env.str("SMTP_USR")
         self.reply_to = env.str("REPLY_TO")
 
-    def send_message(self) -> None:
-        """Send the email."""
-        if not self.email_on:
-            print(self.message.get_content())
-            return
-
-        # Create a secure SSL context
-        context = ssl.create_default_context()
+    @abstractmethod
+    def send(self, message: EmailMessage) -> None:
+        """Send the given message."""
 
-        try:
-            with smtplib.SMTP_SSL(self.smtp_srv, self.smtp_port, context=context) as server:
-                server.ehlo()  # Can be omitted
-                server.login(self.smtp_usr, self.smtp_pwd)
-                server.send_message(self.message)
-                logger.info("Email sent to %s", self.message["To"])
-        except smtplib.SMTPException as err:
-            logger.error("Failed to send email to %s: %s", self.message["To"], err)
-            raise SendMailError from err
+    def send_message(self) -> None:
+        """Send the current message."""
+        self.send(self.message)
 
     def admin_message(self, body: str) -> None:
         """Create an admin email message.
@@ -164,7 +184,7 @@ class EmailNotification(Notification):
 
         """
         msg = EmailMessage()
-        msg["From"] = self.smtp_usr
+        msg["From"] = self.mail_from
         msg["Reply-to"] = self.reply_to
         msg["To"] = mail_to  # type: ignore
         msg["Bcc"] = bcc
@@ -190,10 +210,543 @@ class EmailNotification(Notification):
         self.generate_message(mail_to=emails, subject=subject, body=body, bcc=env.str("ADM_EMAIL"))
 
 
+class EmailNotification(MessageNotification):
+    """Class to send out an email notification."""
+
+    def __init__(self) -> None:
+        """Init EmailNotification."""
+        super().__init__()
+        self.email_on = env.bool("EMAIL_ON", default=False)
+        self.smtp_srv = env.str("SMTP_SRV")
+        self.smtp_port = env.int("SMTP_PORT", default=465)
+        self.smtp_pwd = env.str("SMTP_PWD")
+        self.smtp_timeout = env.float("SMTP_TIMEOUT", default=30.0)
+
+    def send(self, message: EmailMessage) -> None:
+        """Send the email.
+
+        Args:
+            message (EmailMessage): The message to send
+
+        """
+        if not self.email_on:
+            print(message.get_content())
+            return
+
+        # Create a secure SSL context
+        context = ssl.create_default_context()
+
+        try:
+            with smtplib.SMTP_SSL(
+                self.smtp_srv, self.smtp_port, context=context, timeout=self.smtp_timeout
+            ) as server:
+                server.ehlo()  # Can be omitted
+                server.login(self.mail_from, self.smtp_pwd)
+                server.send_message(message)
+                logger.info("Email sent to %s", message["To"])
+        except (smtplib.SMTPException, OSError) as err:
+            logger.error("Failed to send email to %s: %s", message["To"], err)
+            raise SendMailError from err
+
+
+class FileNotification(MessageNotification):
+    """Class to store the notification in a local mbox file."""
+
+    def __init__(self) -> None:
+        """Init FileNotification."""
+        super().__init__()
+        self.mbox_path = env.path("NOTIFY_MBOX", default=Path("notifications.mbox"))
+
+    def send(self, message: EmailMessage) -> None:
+        """Append the message to the mbox file.
+
+        Args:
+            message (EmailMessage): The message to store
+
+        """
+        mbox = mailbox.mbox(self.mbox_path)
+        try:
+            mbox.lock()
+            mbox.add(message)
+            mbox.flush()
+            mbox.unlock()
+        except (OSError, mailbox.Error) as err:
+            logger.error("Failed to store message in %s: %s", self.mbox_path, err)
+            raise SendMailError from err
+        finally:
+            mbox.close()
+        logger.info("Message for %s stored in %s", message["To"], self.mbox_path)
+
+
+class WebhookNotification(MessageNotification):
+    """Class to post the notification as JSON to a webhook."""
+
+    def __init__(self) -> None:
+        """Init WebhookNotification."""
+        super().__init__()
+        self.webhook_url = env.str("NOTIFY_WEBHOOK_URL")
+        self.webhook_timeout = env.float("NOTIFY_WEBHOOK_TIMEOUT", default=10.0)
+
+    def send(self, message: EmailMessage) -> None:
+        """Post the message to the webhook.
+
+        Args:
+            message (EmailMessage): The message to post
+
+        """
+        payload = {
+            "to": message["To"],
+            "subject": message["Subject"],
+            "body": message.get_content(),
+        }
+        request = urllib.request.Request(  # noqa: S310
+            self.webhook_url,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.webhook_timeout):  # noqa: S310
+                pass
+        except OSError as err:
+            logger.error("Failed to post message to %s: %s", self.webhook_url, err)
+            raise SendMailError from err
+        logger.info("Message for %s posted to %s", message["To"], self.webhook_url)
+
+
+class NotificationDispatcher(Notification):
+    """Class to send a notification to several backends concurrently."""
+
+    def __init__(
+        self,
+        backends: list[Notification],
+        timeout: float = 30.0,
+        max_workers: int = 4,
+    ) -> None:
+        """Init NotificationDispatcher.
+
+        Args:
+            backends (list[Notification]): Notification backends to fan out to
+            timeout (float, optional): Deadline in seconds for the whole fan-out.
+                Defaults to 30.0.
+            max_workers (int, optional): Maximum number of concurrent sends. Defaults to 4.
+
+        Raises:
+            ConfigurationError: when no backends are provided
+
+        """
+        if not backends:
+            raise ConfigurationError("No notification backends configured.")
+        self.backends = backends
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    def send_message(self) -> None:
+        """Send the message using all backends at once.
+
+        All sends share one deadline of `timeout` seconds. When there are more backends than
+        `max_workers`, the queued backends get the remaining time only. A backend which
+        fails, does not finish or is not started before the deadline is logged, the send
+        only fails when none of the backends succeeded.
+
+        The message of each backend is captured when the send is submitted, so a backend
+        which is still busy after the deadline keeps sending its own message, even when a
+        new message is generated in the meantime.
+        """
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.backends)))
+        futures = {executor.submit(self._send_job(backend)): backend for backend in self.backends}
+        done, not_done = wait(futures, timeout=self.timeout)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        failed = []
+        for future in not_done:
+            name = type(futures[future]).__name__
+            if future.cancelled():
+                logger.error("%s not started within %ss", name, self.timeout)
+            else:
+                logger.error("%s timed out after %ss", name, self.timeout)
+            failed.append(futures[future])
+        for future in done:
+            if err := future.exception():
+                logger.error("%s failed: %s", type(futures[future]).__name__, err)
+                failed.append(futures[future])
+
+        if len(failed) == len(self.backends):
+            raise SendMailError("All notification backends failed.")
+
+    @staticmethod
+    def _send_job(backend: Notification) -> Callable[[], None]:
+        """Create the send job for a backend, capturing the current message.
+
+        Args:
+            backend (Notification): Notification backend
+
+        Returns:
+            Callable[[], None]: the job to submit
+
+        """
+        if isinstance(backend, MessageNotification):
+            return partial(backend.send, backend.message)
+        return backend.send_message
+
+    def admin_message(self, body: str) -> None:
+        """Generate the admin message for all backends.
+
+        Args:
+            body (str): The body content of the message
+
+        """
+        for backend in self.backends:
+            backend.admin_message(body)
+
+    def generate_message(
+        self,
+        mail_to: Emails,
+        subject: str,
+        body: str,
+        bcc: str = "",
+    ) -> None:
+        """Generate the message for all backends.
+
+        Args:
+            mail_to (EMAILS): A set of email addresses
+            subject (str): Subject of the message
+            body (str): The body content of the message
+            bcc (str, optional): BCC email addresses. Defaults to "".
+
+        """
+        for backend in self.backends:
+            backend.generate_message(mail_to=mail_to, subject=subject, body=body, bcc=bcc)
+
+    def standard_message(self, names: list[str], emails: Emails) -> None:
+        """Generate the standard message for all backends.
+
+        Args:
+            names (list[str]): Names to address the text to
+            emails (EMAILS): a set of email addresses to send the mail to
+
+        """
+        for backend in self.backends:
+            backend.standard_message(names=names, emails=emails)
+
+
+NOTIFICATION_BACKENDS: dict[str, type[Notification]] = {
+    "email": EmailNotification,
+    "mbox": FileNotification,
+    "webhook": WebhookNotification,
+}
+
+
+def notification_backends(names: list[str]) -> list[Notification]:
+    """Create the notification backends by name.
+
+    Args:
+        names (list[str]): Names of the backends, see NOTIFICATION_BACKENDS
+
+    Raises:
+        ConfigurationError: when no or an unknown backend name is provided
+
+    Returns:
+        list[Notification]: the notification backends
+
+    """
+    names = [name.strip() for name in names if name.strip()]
+    if not names:
+        raise ConfigurationError("No notification backends configured.")
+    if unknown := [name for name in names if name not in NOTIFICATION_BACKENDS]:
+        raise ConfigurationError(
+            f"Unknown notification backend(s): {', '.join(unknown)}. "
+            f"Choose from: {', '.join(NOTIFICATION_BACKENDS)}."
+        )
+    return [NOTIFICATION_BACKENDS[name]() for name in names]
+
+
+class NameTokenizer:
+    """Split schedule cells into names and normalize names to canonical keys.
+
+    The separator pattern is compiled once and the keys are cached, so a single instance can be
+    shared between the schedule and the contacts.
+    """
+
+    separators = re.compile(r",| en |/|\.")
+
+    def split(self, cell: str) -> list[str]:
+        """Extract the names from a schedule cell.
+
+        Whitespace is collapsed and names with the same key are only returned once.
+
+        Args:
+            cell (str): Provide the names
+
+        Returns:
+            list[str]: list of names
+
+        """
+        names: dict[str, str] = {}
+        for token in self.separators.split(cell):
+            if (name := token.strip()) and (name_key := self.key(name)) not in names:
+                names[name_key] = " ".join(name.split())
+        return list(names.values())
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def key(name: str) -> str:
+        """Normalize a name for case, whitespace and diacritics.
+
+        Args:
+            name (str): Persons name
+
+        Returns:
+            str: the canonical name key
+
+        """
+        if name.isascii():
+            return " ".join(name.lower().split())
+        decomposed = unicodedata.normalize("NFKD", name)
+        stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+        return " ".join(stripped.casefold().split())
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def word_pattern(name_key: str) -> re.Pattern[str]:
+        """Compile a pattern matching the name key as whole word(s)."""
+        return re.compile(rf"\b{re.escape(name_key)}\b")
+
+
+name_tokenizer = NameTokenizer()
+
+
+class NameCache:
+    """Persistent LRU cache mapping normalized names to email addresses.
+
+    The cache is bound to a hash of the contacts sheet. Whenever the contacts data
+    changes, all cached resolutions are dropped.
+    """
+
+    def __init__(self, path: Path, max_size: int = 256) -> None:
+        """Initialize NameCache.
+
+        Args:
+            path (Path): File to persist the cache in
+            max_size (int, optional): Maximum number of cached names. Defaults to 256.
+
+        """
+        self.path = path
+        self.max_size = max_size
+        self.contacts_hash = ""
+        self.entries: OrderedDict[str, Emails] = OrderedDict()
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalize a name to be used as cache key."""
+        return name_tokenizer.key(name)
+
+    def load(self) -> None:
+        """Load the cache from disk, an unreadable file results in an empty cache."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.contacts_hash = data["contacts_hash"]
+            self.entries = OrderedDict((key, set(emails)) for key, emails in data["entries"])
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            logger.debug("Name cache not loaded from %s: %s", self.path, err)
+            self.contacts_hash = ""
+            self.entries = OrderedDict()
+        self._evict()
+
+    def save(self) -> None:
+        """Write the cache to disk.
+
+        The cache is written to a temporary file first and then moved in place, so a crash
+        or a concurrent run never leaves a truncated cache behind.
+        """
+        data = {
+            "contacts_hash": self.contacts_hash,
+            "entries": [[key, sorted(emails)] for key, emails in self.entries.items()],
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(data, fp)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def validate(self, contacts_hash: str) -> None:
+        """Drop all entries when the contacts data differs from the cached version.
+
+        Args:
+            contacts_hash (str): Hash of the current contacts data
+
+        """
+        if contacts_hash != self.contacts_hash:
+            self.entries.clear()
+            self.contacts_hash = contacts_hash
+
+    def get(self, name: str) -> Emails | None:
+        """Return the cached email addresses for a name, if present."""
+        key = self.normalize(name)
+        if key not in self.entries:
+            return None
+        self.entries.move_to_end(key)
+        return set(self.entries[key])
+
+    def put(self, name: str, emails: Emails) -> None:
+        """Store the email addresses for a name."""
+        key = self.normalize(name)
+        self.entries[key] = set(emails)
+        self.entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries exceeding max_size."""
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+
+@dataclass
+class RunRecord:
+    """Measurements of a single run."""
+
+    tenant: str
+    started: str
+    outcome: str = ""
+    durations: dict[str, float] = field(default_factory=dict)
+    api_retries: int = 0
+    payload_sizes: dict[str, int] = field(default_factory=dict)
+    recipients: int = 0
+
+
+class _RetryCounter(logging.Handler):
+    """Count the retries logged by the Google API client."""
+
+    def __init__(self, record: RunRecord) -> None:
+        """Initialize _RetryCounter.
+
+        Args:
+            record (RunRecord): The run to count the retries for
+
+        """
+        super().__init__(level=logging.WARNING)
+        self.record = record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count the log record when it announces a retry.
+
+        Args:
+            record (logging.LogRecord): The logged record
+
+        """
+        if "before retry" in record.getMessage():
+            self.record.api_retries += 1
+
+
+class RunHistory:
+    """Append-only JSONL store of the measurements per run."""
+
+    def __init__(self, path: Path, tenant: str = "default") -> None:
+        """Initialize RunHistory.
+
+        Args:
+            path (Path): JSONL file to append the runs to
+            tenant (str, optional): Name of the tenant. Defaults to "default".
+
+        """
+        self.path = path
+        self.record = RunRecord(tenant=tenant, started=datetime.now().isoformat(timespec="seconds"))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the duration of a stage, repeated stages are summed.
+
+        Args:
+            name (str): Name of the stage
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.record.durations[name] = self.record.durations.get(name, 0.0) + duration
+
+    @contextmanager
+    def count_retries(self) -> Iterator[None]:
+        """Count the Google API retries which are logged within the context."""
+        handler = _RetryCounter(self.record)
+        api_logger = logging.getLogger("googleapiclient.http")
+        api_logger.addHandler(handler)
+        try:
+            yield
+        finally:
+            api_logger.removeHandler(handler)
+
+    def save(self) -> None:
+        """Append the current run to the history file."""
+        with self.path.open("a", encoding="utf-8") as fp:
+            fp.write(json.dumps(asdict(self.record)) + "\n")
+
+    def load(self) -> list[RunRecord]:
+        """Read all runs from the history file, skipping unreadable lines.
+
+        Returns:
+            list[RunRecord]: the recorded runs
+
+        """
+        if not self.path.exists():
+            return []
+        records = []
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                records.append(RunRecord(**json.loads(line)))
+            except (ValueError, TypeError) as err:
+                logger.debug("Skipping run history line %r: %s", line, err)
+        return records
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Calculate the percentile using the nearest-rank method.
+
+    Args:
+        values (list[float]): The measured values
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: the value at the percentile
+
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def history_report(records: list[RunRecord]) -> str:
+    """Generate a report with the duration percentiles per tenant and stage.
+
+    Args:
+        records (list[RunRecord]): The recorded runs
+
+    Returns:
+        str: the report
+
+    """
+    durations: dict[tuple[str, str], list[float]] = {}
+    for record in records:
+        for stage, duration in record.durations.items():
+            durations.setdefault((record.tenant, stage), []).append(duration)
+
+    lines = [f"{'tenant':<16}{'stage':<16}{'runs':>6}{'p50':>10}{'p95':>10}{'p99':>10}"]
+    for (tenant, stage), values in sorted(durations.items()):
+        p50, p95, p99 = (percentile(values, pct) for pct in (50, 95, 99))
+        lines.append(f"{tenant:<16}{stage:<16}{len(values):>6}{p50:>10.3f}{p95:>10.3f}{p99:>10.3f}")
+    return "\n".join(lines)
+
+
 class GSheet:  # pylint: disable=too-few-public-methods
     """Defining the superclass to extract data from a Google Sheet."""
 
     sheet: Sheet
+    payload_size: int = 0
     notification: Notification
     sheet_id: str
     sheet_range: str
@@ -221,46 +774,110 @@ class GSheet:  # pylint: disable=too-few-public-methods
         values = sheet.values()
         spreadsheet = values.get(spreadsheetId=self.sheet_id, range=self.sheet_range)
         result = spreadsheet.execute()
+        self.payload_size = len(json.dumps(result).encode())
         self.sheet = result.get("values", [])
 
 
 class Contacts(GSheet):
     """Class to extract and use contact data."""
 
-    def __init__(self, credentials: Credentials, notification: Notification):
+    def __init__(
+        self,
+        credentials: Credentials,
+        notification: Notification,
+        name_cache: NameCache | None = None,
+    ):
         """Initialize Contacts class.
 
         Args:
             credentials (Credentials): Google credentials
             notification (Notification): Notification type class
+            name_cache (NameCache | None, optional): Cache for resolved names. Defaults to None.
 
         """
         self.contacts_name_email: PersonInfo = {}
+        self.contacts_hash = ""
+        self._rows: dict[str, tuple[str, ...]] = {}
         self.mailing_list: Emails = set()
+        self.unresolved_names: list[str] = []
+        self.name_cache = name_cache
         self.sheet_id = env.str("CONTACTS_SHEET_ID")
         self.sheet_range = f"contacts!{env.str('CONTACTS_SHEET_RANGE')}"
         super().__init__(credentials, notification)
 
-    def get_contact_name_email(self):
-        """Extract contacts information."""
-        name_mail_dict = {}
+    def get_contact_name_email(self) -> ContactsDiff:
+        """Extract contacts information.
+
+        The rows are compared with the previous fetch, only added, changed and removed rows
+        are applied to the contacts.
+
+        Returns:
+            ContactsDiff: the names which were added, changed or removed
 
+        """
+        rows: dict[str, tuple[str, ...]] = {}
         for line in self.sheet:
-            if len(line) == 4:
-                name, email, _, extra_namen = line
-            elif len(line) == 3:
-                extra_namen = ""
-                name, email, _ = line
-            else:
+            if len(line) not in (3, 4):
                 print(f"Could not process line: {line}")
                 continue
+            rows[line[0]] = tuple(line)
+
+        diff = self._diff_rows(rows)
+        self._rows = rows
+
+        for name in diff.removed:
+            del self.contacts_name_email[name]
+        for name in diff.added + diff.changed:
+            self.contacts_name_email[name] = self._row_to_person(rows[name])
+
+        # The hash is also needed for the first fetch, as an empty sheet has an empty diff.
+        if diff.added or diff.changed or diff.removed or not self.contacts_hash:
+            self.contacts_hash = hashlib.sha256(json.dumps(self.sheet).encode()).hexdigest()
+        if self.name_cache is not None:
+            self.name_cache.validate(self.contacts_hash)
+        return diff
+
+    @staticmethod
+    def _row_to_person(row: tuple[str, ...]) -> Person:
+        """Convert a contacts row to a Person.
+
+        Args:
+            row (tuple[str, ...]): row data, with 3 or 4 fields
+
+        Returns:
+            Person: the contact
+
+        """
+        name, email, _, *extra = row
+        return Person(name=name, email=email, extra=extra[0] if extra else "")
+
+    def _diff_rows(self, rows: dict[str, tuple[str, ...]]) -> ContactsDiff:
+        """Compare the rows with the previous fetch.
+
+        Args:
+            rows (dict[str, tuple[str, ...]]): row data per contact name
+
+        Returns:
+            ContactsDiff: the names which were added, changed or removed
 
-            name_mail_dict[name] = Person(name=name, email=email, extra=extra_namen)
-        self.contacts_name_email = name_mail_dict
+        """
+        previous = self._rows
+        diff = ContactsDiff()
+        for name, row in rows.items():
+            if (previous_row := previous.get(name)) is None:
+                diff.added.append(name)
+            elif previous_row != row:
+                diff.changed.append(name)
+        if len(previous) > len(rows) - len(diff.added):
+            diff.removed = [name for name in previous if name not in rows]
+        return diff
 
     def generate_mailing_list(self, names: list[str]) -> Emails:
         """Generate the mailing list using the contact data.
 
+        Names which could not be found are collected in unresolved_names, use
+        notify_unresolved to inform the admin.
+
         Args:
             names (list[str]): The email address is searched based on the provided names
 
@@ -270,15 +887,46 @@ class Contacts(GSheet):
         """
         for name in names:
             if name:
-                self.mailing_list = self.mailing_list.union(
-                    self._find_email_based_on_name_list(name, self.contacts_name_email)
-                )
+                self.mailing_list = self.mailing_list.union(self._resolve_name(name))
         return self.mailing_list
 
+    def notify_unresolved(self) -> None:
+        """Send an admin message for each name which could not be found in the contacts."""
+        for name_key in self.unresolved_names:
+            msg = f"Action required.\nName: {name_key!r} not found in contacts."
+            self.notification.admin_message(msg)
+            self.notification.send_message()
+        self.unresolved_names = []
+
+    def _resolve_name(self, name: str) -> Emails:
+        """Resolve a name to email addresses, using the name cache when available.
+
+        Names which could not be resolved are not cached, so the admin keeps being notified
+        on every run.
+
+        Args:
+            name (str): Persons name
+
+        Returns:
+            EMAILS (set[str]): a set of email addresses
+
+        """
+        if self.name_cache is None:
+            return self._find_email_based_on_name_list(name, self.contacts_name_email)
+
+        if (emails := self.name_cache.get(name)) is not None:
+            return emails
+
+        emails = self._find_email_based_on_name_list(name, self.contacts_name_email)
+        if emails:
+            self.name_cache.put(name, emails)
+        return emails
+
     def _find_email_based_on_name_list(self, name: str, contacts: PersonInfo) -> Emails:
         """Given the contact_dict find the email address based on the name field.
 
-        If not found, the 'extra' field is used.
+        If not found, the 'extra' field is used. If still not found, the name is added to
+        unresolved_names.
 
         Args:
             name (str): Persons name
@@ -288,22 +936,22 @@ class Contacts(GSheet):
             EMAILS (set[str]): a set of email addresses
 
         """
-        name = name.lower()
+        name_key = name_tokenizer.key(name)
 
-        email_list = [data.email for key, data in contacts.items() if key.lower().startswith(name)]
+        email_list = [
+            data.email for data in contacts.values() if data.name_key.startswith(name_key)
+        ]
 
         if not email_list:
-            regex = re.compile(pattern=rf"\b{name}\b", flags=re.IGNORECASE)
+            regex = name_tokenizer.word_pattern(name_key)
             for data in contacts.values():
-                if data.extra and regex.search(data.extra):
+                if data.extra_key and regex.search(data.extra_key):
                     email_list.append(data.email)
 
         if email_list:
             return set(email_list)
 
-        msg = f"Action required.\nName: {name!r} not found in contacts."
-        self.notification.admin_message(msg)
-        self.notification.send_message()
+        self.unresolved_names.append(name_key)
         return set()
 
 
@@ -373,8 +1021,7 @@ class ScheduleSheet(GSheet):
             list[str]: list of names
 
         """
-        split_names = re.split(pattern=r",| en |/|\.", string=names)
-        return [name.strip() for name in split_names if name]
+        return name_tokenizer.split(names)
 
     def names_next_date(self) -> tuple[list[str], Err]:
         """Extract the names for the upcoming date.
@@ -1,7 +1,11 @@
 """pytest groene_maaiers."""
 
 import json
+import mailbox
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
 import pytest
@@ -321,3 +325,394 @@ def test_generate_message(notification: gm.EmailNotification) -> None:
 
     assert mail_dict["Bcc"] == bcc
     assert mail_dict["Reply-to"] == os.environ["REPLY_TO"]
+
+
+@pytest.fixture
+def name_cache(tmp_path: Path) -> gm.NameCache:
+    return gm.NameCache(path=tmp_path / "name_cache.json", max_size=2)
+
+
+def test_name_cache_lru_eviction(name_cache: gm.NameCache) -> None:
+    name_cache.put("Name1", {"name1@domain.nl"})
+    name_cache.put("Name2", {"name2@domain.nl"})
+    assert name_cache.get("name1") == {"name1@domain.nl"}
+    name_cache.put("Name3", {"name3@domain.nl"})
+
+    assert name_cache.get("Name2") is None
+    assert name_cache.get(" NAME1 ") == {"name1@domain.nl"}
+    assert name_cache.get("Name3") == {"name3@domain.nl"}
+
+
+def test_name_cache_persistence(name_cache: gm.NameCache) -> None:
+    name_cache.validate("hash1")
+    name_cache.put("Name1", {"name1@domain.nl"})
+    name_cache.save()
+
+    loaded = gm.NameCache(path=name_cache.path)
+    loaded.load()
+    loaded.validate("hash1")
+    assert loaded.get("Name1") == {"name1@domain.nl"}
+
+    loaded.validate("hash2")
+    assert loaded.get("Name1") is None
+
+
+def test_name_cache_save_replaces_file(name_cache: gm.NameCache) -> None:
+    name_cache.path.write_text("stale", encoding="utf-8")
+    name_cache.put("Name1", {"name1@domain.nl"})
+    name_cache.save()
+
+    assert list(name_cache.path.parent.iterdir()) == [name_cache.path]
+    loaded = gm.NameCache(path=name_cache.path)
+    loaded.load()
+    assert loaded.get("Name1") == {"name1@domain.nl"}
+
+
+def test_name_cache_matches_resolution_normalization(
+    contacts: gm.Contacts, expected_contacts: dict[str, gm.Person]
+) -> None:
+    for spelling in ("Name1  LastName1", " name1 lastname1"):
+        assert gm.NameCache.normalize(spelling) == gm.name_tokenizer.key(spelling)
+        assert contacts._find_email_based_on_name_list(spelling, expected_contacts) == {
+            "name1.lastname1@domain.nl"
+        }
+
+
+def test_name_cache_load_missing_file(name_cache: gm.NameCache) -> None:
+    name_cache.load()
+    assert name_cache.contacts_hash == ""
+    assert not name_cache.entries
+
+
+def test_generate_mailing_list_uses_cache(
+    notify: gm.Notification, credentials: gm.Credentials, name_cache: gm.NameCache
+) -> None:
+    contacts = gm.Contacts(
+        credentials=credentials, notification=notify, name_cache=name_cache
+    )
+    contacts.sheet = [["Name1 LastName1", "name1.lastname1@domain.nl", "adres 1"]]
+    contacts.get_contact_name_email()
+    assert contacts.generate_mailing_list(["Name1", "Unknown"]) == {
+        "name1.lastname1@domain.nl"
+    }
+    assert name_cache.contacts_hash == contacts.contacts_hash
+    assert name_cache.get("Unknown") is None
+
+    contacts.contacts_name_email = {}
+    contacts.mailing_list = set()
+    assert contacts.generate_mailing_list(["Name1"]) == {"name1.lastname1@domain.nl"}
+
+    contacts.sheet = [["Name1 LastName1", "other@domain.nl", "adres 1"]]
+    contacts.get_contact_name_email()
+    assert name_cache.get("Name1") is None
+
+
+def test_get_contact_name_email_incremental(
+    contacts: gm.Contacts, expected_contacts: dict[str, gm.Person]
+) -> None:
+    contacts.sheet = [
+        ["Name1 LastName1", "name1.lastname1@domain.nl", "adres 1", "other name"],
+        ["Name2 LastName2", "name2.lastname2@domain.nl", "adres 5"],
+        ["Obsolete", "obsolete@domain.nl", "adres 9"],
+    ]
+    diff = contacts.get_contact_name_email()
+    assert diff.added == ["Name1 LastName1", "Name2 LastName2", "Obsolete"]
+    unchanged = contacts.contacts_name_email["Name1 LastName1"]
+    first_hash = contacts.contacts_hash
+
+    contacts.sheet = [
+        ["Name1 LastName1", "name1.lastname1@domain.nl", "adres 1", "other name"],
+        ["Name2 LastName2", "name2.lastname2@domain.nl", "adres 5"],
+        ["Name3 LastName3", "name3.lastname3@domain.nl", "adres 7", "Name4 LastName4"],
+    ]
+    diff = contacts.get_contact_name_email()
+    assert diff == gm.ContactsDiff(added=["Name3 LastName3"], removed=["Obsolete"])
+    assert contacts.contacts_name_email == expected_contacts
+    assert contacts.contacts_name_email["Name1 LastName1"] is unchanged
+    assert contacts.contacts_hash != first_hash
+
+    contacts.sheet[1] = ["Name2 LastName2", "new@domain.nl", "adres 5"]
+    diff = contacts.get_contact_name_email()
+    assert diff == gm.ContactsDiff(changed=["Name2 LastName2"])
+    assert contacts.contacts_name_email["Name2 LastName2"].email == "new@domain.nl"
+
+
+class FakeBackend(gm.Notification):
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.body = ""
+        self.sent = False
+
+    def send_message(self) -> None:
+        time.sleep(self.delay)
+        if self.fail:
+            raise gm.SendMailError("failed")
+        self.sent = True
+
+    def admin_message(self, body: str) -> None:
+        self.body = body
+
+    def generate_message(self, mail_to, subject, body, bcc="") -> None:
+        self.body = body
+
+    def standard_message(self, names, emails) -> None:
+        self.body = ", ".join(names)
+
+
+def test_dispatcher_fans_out_concurrently() -> None:
+    backends = [FakeBackend(delay=0.2), FakeBackend(delay=0.2), FakeBackend(delay=0.2)]
+    dispatcher = gm.NotificationDispatcher(backends=backends, timeout=5)
+    dispatcher.standard_message(names=["name1", "name2"], emails={"to@domain.nl"})
+
+    start = time.perf_counter()
+    dispatcher.send_message()
+    assert time.perf_counter() - start < 0.5
+    assert all(backend.sent for backend in backends)
+    assert all(backend.body == "name1, name2" for backend in backends)
+
+
+def test_dispatcher_slow_and_failing_backends() -> None:
+    fast, slow, failing = FakeBackend(), FakeBackend(delay=1), FakeBackend(fail=True)
+    dispatcher = gm.NotificationDispatcher(backends=[fast, slow, failing], timeout=0.1)
+    dispatcher.admin_message("body")
+
+    start = time.perf_counter()
+    dispatcher.send_message()
+    assert time.perf_counter() - start < 0.5
+    assert fast.sent
+    assert not slow.sent
+
+    dispatcher = gm.NotificationDispatcher(backends=[failing], timeout=0.1)
+    with pytest.raises(gm.SendMailError):
+        dispatcher.send_message()
+
+
+def test_file_notification(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    mbox_path = tmp_path / "notifications.mbox"
+    monkeypatch.setenv("NOTIFY_MBOX", str(mbox_path))
+    notification = gm.FileNotification()
+    notification.admin_message("body")
+    notification.send_message()
+    notification.send_message()
+
+    messages = list(mailbox.mbox(mbox_path))
+    assert len(messages) == 2
+    assert messages[0]["To"] == os.environ["ADM_EMAIL"]
+
+
+def test_webhook_notification(monkeypatch: pytest.MonkeyPatch) -> None:
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers["Content-Length"])
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.handle_request)
+    thread.start()
+    monkeypatch.setenv("NOTIFY_WEBHOOK_URL", f"http://127.0.0.1:{server.server_port}/")
+    notification = gm.WebhookNotification()
+    notification.generate_message(mail_to={"to@domain.nl"}, subject="subject", body="body")
+    notification.send_message()
+    thread.join()
+    server.server_close()
+
+    assert received == [{"to": "to@domain.nl", "subject": "subject", "body": "body\n"}]
+
+    with pytest.raises(gm.SendMailError):
+        notification.send_message()
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
+        ("Name1", "name1"),
+        ("  NAME1   LastName1 ", "name1 lastname1"),
+        ("Renée Çelik", "renee celik"),
+    ],
+)
+def test_name_tokenizer_key(test_input: str, expected: str) -> None:
+    assert gm.name_tokenizer.key(test_input) == expected
+
+
+def test_name_tokenizer_split() -> None:
+    assert gm.name_tokenizer.split("Renée, renee en Name2  Last / RENÉE.") == [
+        "Renée",
+        "Name2 Last",
+    ]
+    assert gm.name_tokenizer.split("Name1 \tLast, Name2\t\tLast") == [
+        "Name1 Last",
+        "Name2 Last",
+    ]
+
+
+def test_find_email_based_on_name_list_normalized(contacts: gm.Contacts) -> None:
+    people = {
+        "Renée Çelik": gm.Person(name="Renée Çelik", email="renee@domain.nl"),
+        "Name1": gm.Person(name="Name1", email="name1@domain.nl", extra="Zoë  de Vries"),
+    }
+    assert contacts._find_email_based_on_name_list("renee", people) == {
+        "renee@domain.nl"
+    }
+    assert contacts._find_email_based_on_name_list("ZOE de vries", people) == {
+        "name1@domain.nl"
+    }
+
+
+def test_run_history_save_and_load(tmp_path: Path) -> None:
+    history = gm.RunHistory(path=tmp_path / "run_history.jsonl", tenant="tenant1")
+    with history.stage("send"):
+        pass
+    with history.count_retries():
+        gm.logging.getLogger("googleapiclient.http").warning(
+            "Sleeping %.2f seconds before retry %d of %d", 1.0, 1, 3
+        )
+    history.record.outcome = "sent"
+    history.save()
+    history.save()
+    with history.path.open("a") as fp:
+        fp.write("not json\n")
+
+    records = history.load()
+    assert len(records) == 2
+    assert records[0] == history.record
+    assert records[0].api_retries == 1
+    assert "send" in records[0].durations
+
+
+@pytest.mark.parametrize(
+    "pct,expected",
+    [(50, 5.0), (95, 10.0), (99, 10.0), (0, 1.0)],
+)
+def test_percentile(pct: float, expected: float) -> None:
+    assert gm.percentile([float(i) for i in range(10, 0, -1)], pct) == expected
+
+
+def test_history_report() -> None:
+    records = [
+        gm.RunRecord(tenant="t1", started="", durations={"send": 1.0, "matching": 0.5}),
+        gm.RunRecord(tenant="t1", started="", durations={"send": 3.0}),
+        gm.RunRecord(tenant="t2", started="", durations={"send": 2.0}),
+    ]
+    lines = gm.history_report(records).splitlines()
+    assert lines[0].split() == ["tenant", "stage", "runs", "p50", "p95", "p99"]
+    assert [line.split() for line in lines[1:]] == [
+        ["t1", "matching", "1", "0.500", "0.500", "0.500"],
+        ["t1", "send", "2", "1.000", "3.000", "3.000"],
+        ["t2", "send", "1", "2.000", "2.000", "2.000"],
+    ]
+
+
+def test_get_contact_name_email_unchanged_refresh(contacts: gm.Contacts) -> None:
+    contacts.sheet = [
+        [f"Name{i} LastName{i}", f"name{i}@domain.nl", f"adres {i}", f"extra {i}"]
+        for i in range(10)
+    ]
+    contacts.get_contact_name_email()
+    people = dict(contacts.contacts_name_email)
+    contacts_hash = contacts.contacts_hash
+
+    contacts.sheet = [list(row) for row in contacts.sheet]
+    assert contacts.get_contact_name_email() == gm.ContactsDiff()
+    assert contacts.contacts_hash == contacts_hash
+    assert all(contacts.contacts_name_email[name] is person for name, person in people.items())
+
+
+def test_cache_from_disk_with_empty_contacts_sheet(
+    notify: gm.Notification, credentials: gm.Credentials, name_cache: gm.NameCache
+) -> None:
+    contacts = gm.Contacts(credentials=credentials, notification=notify, name_cache=name_cache)
+    contacts.sheet = [["Name1 LastName1", "name1.lastname1@domain.nl", "adres 1"]]
+    contacts.get_contact_name_email()
+    assert contacts.generate_mailing_list(["Name1"]) == {"name1.lastname1@domain.nl"}
+    name_cache.save()
+
+    loaded = gm.NameCache(path=name_cache.path)
+    loaded.load()
+    contacts = gm.Contacts(credentials=credentials, notification=notify, name_cache=loaded)
+    contacts.sheet = []
+    assert contacts.get_contact_name_email() == gm.ContactsDiff()
+    assert contacts.generate_mailing_list(["Name1"]) == set()
+    assert contacts.unresolved_names == ["name1"]
+
+
+class SlowMessageBackend(gm.MessageNotification):
+    def __init__(self, delay: float, subjects: list[str]) -> None:
+        super().__init__()
+        self.delay = delay
+        self.sent_events = {subject: threading.Event() for subject in subjects}
+
+    def send(self, message) -> None:
+        time.sleep(self.delay)
+        self.sent_events[message["Subject"]].set()
+
+
+def test_dispatcher_captures_message_of_slow_backend() -> None:
+    admin_subject = "Groen email script issue"
+    standard_subject = f"Groen onderhoud herinnering voor {gm.get_next_saturday_datetime()}"
+    slow = SlowMessageBackend(delay=0.2, subjects=[admin_subject, standard_subject])
+    dispatcher = gm.NotificationDispatcher(backends=[slow, FakeBackend()], timeout=0.05)
+    dispatcher.admin_message("Name not found")
+    dispatcher.send_message()
+    dispatcher.standard_message(names=["name1"], emails={"to@domain.nl"})
+    dispatcher.send_message()
+
+    assert slow.sent_events[admin_subject].wait(timeout=5)
+    assert slow.sent_events[standard_subject].wait(timeout=5)
+
+
+def test_dispatcher_without_backends() -> None:
+    with pytest.raises(gm.ConfigurationError):
+        gm.NotificationDispatcher(backends=[])
+
+
+@pytest.mark.parametrize("names", [[], [""], ["email", "smtp"]])
+def test_notification_backends_invalid(names: list[str]) -> None:
+    with pytest.raises(gm.ConfigurationError):
+        gm.notification_backends(names)
+
+
+def test_notification_backends() -> None:
+    backends = gm.notification_backends(["email", " mbox "])
+    assert [type(backend) for backend in backends] == [
+        gm.EmailNotification,
+        gm.FileNotification,
+    ]
+
+
+def test_dispatcher_shared_deadline(caplog: pytest.LogCaptureFixture) -> None:
+    running, queued = FakeBackend(delay=0.3), FakeBackend()
+    dispatcher = gm.NotificationDispatcher(
+        backends=[running, queued], timeout=0.05, max_workers=1
+    )
+    with pytest.raises(gm.SendMailError):
+        dispatcher.send_message()
+
+    assert "FakeBackend timed out after 0.05s" in caplog.text
+    assert "FakeBackend not started within 0.05s" in caplog.text
+    assert not queued.sent
+
+
+def test_notify_unresolved(
+    credentials: gm.Credentials, expected_contacts: dict[str, gm.Person]
+) -> None:
+    backend = FakeBackend()
+    contacts = gm.Contacts(credentials=credentials, notification=backend)
+    contacts.contacts_name_email = expected_contacts
+    assert contacts.generate_mailing_list(["Name2", "Unknown"]) == {
+        "name2.lastname2@domain.nl"
+    }
+    assert contacts.unresolved_names == ["unknown"]
+    assert not backend.sent
+
+    contacts.notify_unresolved()
+    assert backend.sent
+    assert "'unknown' not found in contacts" in backend.body
+    assert contacts.unresolved_names == []